@@ -23,25 +23,35 @@ Docs:
 
 import os
 import sys
-import json
+import hmac
+import asyncio
+import subprocess
+from contextlib import asynccontextmanager
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Header
-from fastapi.responses import JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
+import anyio
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-import subprocess
+import orjson
+
+import contacts_store
 
 from config import (
     APP_NAME,
+    APP_VERSION,
     APP_ENV,
     API_KEY,
-    CONTACTS_FILE,
+    BASE_DIR,
     SCHEDULE_TIME,
     STREAK_MESSAGE,
     HEADLESS_MODE,
+    CORS_ORIGINS,
     HOST,
     PORT,
+    WORKERS,
+    THREAD_LIMIT,
 )
 
 # =============================================================================
@@ -78,26 +88,129 @@ BANNER = r"""
 
 print(BANNER)
 
+# =============================================================================
+# CORS Middleware
+# =============================================================================
+
+class FastCORSMiddleware:
+    """
+    Minimal CORS middleware with all response headers built once at startup.
+    
+    Credentials are always allowed, so the request origin is echoed back
+    instead of "*". Preflight requests are answered without hitting the router.
+    """
+    
+    ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+    
+    def __init__(self, app, allow_origins):
+        self.app = app
+        self.allow_all = "*" in allow_origins
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.simple_headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self.preflight_headers = self.simple_headers + [
+            (b"access-control-allow-methods", self.ALLOW_METHODS),
+            (b"access-control-max-age", b"600"),
+        ]
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        allowed = self.allow_all or origin in self.allow_origins
+        
+        # Preflight request
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if not allowed:
+                await send({
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+                })
+                await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+                return
+            
+            headers = self.preflight_headers + [(b"access-control-allow-origin", origin)]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+        
+        extra_headers = self.simple_headers + [(b"access-control-allow-origin", origin)]
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+
 # =============================================================================
 # FastAPI App
 # =============================================================================
 
+# Server time at 1-second resolution, refreshed by a background task so
+# /status doesn't have to build and format a datetime on every request
+_now_iso = datetime.now().isoformat()
+
+
+async def _refresh_now_iso():
+    """Update the cached server time once per second."""
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(1)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Start and stop background tasks with the server."""
+    # Default AnyIO limit is 40 threads per worker
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_LIMIT
+    
+    clock_task = asyncio.create_task(_refresh_now_iso())
+    try:
+        yield
+    finally:
+        clock_task.cancel()
+
+
 app = FastAPI(
     title=APP_NAME,
     description="REST API for controlling TikTok Streak Bot. Created by dewhush.",
-    version="1.0.0",
+    version=APP_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS Configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Update with specific domains in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORSMiddleware, allow_origins=CORS_ORIGINS)
 
 
 # =============================================================================
@@ -122,14 +235,18 @@ class ApiResponse(BaseModel):
 # Authentication
 # =============================================================================
 
+# Encoded once at import; None when no key is configured
+_API_KEY_BYTES = API_KEY.encode('utf-8') if API_KEY else None
+
+
 async def verify_api_key(x_api_key: str = Header(None)):
     """Verify API key from X-API-Key header."""
-    if not API_KEY:
+    if _API_KEY_BYTES is None:
         raise HTTPException(
             status_code=500,
             detail="API key not configured. Set API_KEY in .env file."
         )
-    if not x_api_key or x_api_key != API_KEY:
+    if not x_api_key or not hmac.compare_digest(x_api_key.encode('utf-8'), _API_KEY_BYTES):
         raise HTTPException(
             status_code=401,
             detail="Invalid or missing API key"
@@ -141,45 +258,36 @@ async def verify_api_key(x_api_key: str = Header(None)):
 # Helper Functions
 # =============================================================================
 
-def load_contacts():
-    """Load contacts from JSON file."""
-    if not os.path.exists(CONTACTS_FILE):
-        return []
-    
-    try:
-        with open(CONTACTS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get('contacts', [])
-    except Exception:
-        return []
-
-
-def save_contacts(contacts):
-    """Save contacts to JSON file."""
-    try:
-        with open(CONTACTS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({"contacts": contacts}, f, indent=4, ensure_ascii=False)
-        return True
-    except Exception:
-        return False
+# Bot script location and base command, built once instead of on every launch
+BOT_SCRIPT = os.path.join(BASE_DIR, 'streak_bot.py')
+BOT_BASE_CMD = (sys.executable, BOT_SCRIPT, '--now')
 
 
-def run_streak_bot(custom_message: str = None):
+async def run_streak_bot(custom_message: str = None):
     """Run the streak bot in background."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    bot_script = os.path.join(script_dir, 'streak_bot.py')
-    
-    cmd = [sys.executable, bot_script, '--now']
     if custom_message:
-        cmd.extend(['--message', custom_message])
+        cmd = (*BOT_BASE_CMD, f'--message={custom_message}')
+    else:
+        cmd = BOT_BASE_CMD
     
     try:
-        subprocess.Popen(
-            cmd,
-            cwd=script_dir,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        try:
+            await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=BASE_DIR,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except NotImplementedError:
+            # Windows SelectorEventLoop (uvicorn --reload) can't spawn
+            # subprocesses; start it with Popen off the event loop instead
+            await asyncio.to_thread(
+                subprocess.Popen,
+                cmd,
+                cwd=BASE_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
         return True
     except Exception as e:
         print(f"Error running bot: {e}")
@@ -190,60 +298,74 @@ def run_streak_bot(custom_message: str = None):
 # API Endpoints - General
 # =============================================================================
 
+# Payloads that never change for the lifetime of the process
+_ROOT_BYTES = orjson.dumps({
+    "name": APP_NAME,
+    "version": APP_VERSION,
+    "environment": APP_ENV,
+    "creator": "dewhush",
+    "docs": "/docs",
+    "endpoints": {
+        "health": "GET /health",
+        "status": "GET /status",
+        "run_streak": "POST /v1/streak",
+        "list_contacts": "GET /v1/contacts",
+        "add_contact": "POST /v1/contacts",
+        "remove_contact": "DELETE /v1/contacts/{nickname}"
+    }
+})
+
+_HEALTH_BYTES = b'{"status":"healthy"}'
+
+# Read-only so no handler can mutate the shared dict
+_STATUS_STATIC = MappingProxyType({
+    "app_name": APP_NAME,
+    "version": APP_VERSION,
+    "environment": APP_ENV,
+    "python_version": sys.version,
+    "schedule_time": SCHEDULE_TIME,
+    "headless_mode": HEADLESS_MODE,
+    "creator": "dewhush"
+})
+
+
 @app.get("/", tags=["General"])
 async def root():
     """API root - welcome message."""
-    return {
-        "name": APP_NAME,
-        "version": "1.0.0",
-        "environment": APP_ENV,
-        "creator": "dewhush",
-        "docs": "/docs",
-        "endpoints": {
-            "health": "GET /health",
-            "status": "GET /status",
-            "run_streak": "POST /v1/streak",
-            "list_contacts": "GET /v1/contacts",
-            "add_contact": "POST /v1/contacts",
-            "remove_contact": "DELETE /v1/contacts/{nickname}"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health", tags=["General"])
 async def health_check():
     """Health check for monitoring tools."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/status", tags=["General"])
 async def get_status():
     """Get detailed server status."""
-    contacts = load_contacts()
+    contacts = await contacts_store.get_contacts()
     
-    return {
-        "app_name": APP_NAME,
-        "version": "1.0.0",
-        "environment": APP_ENV,
-        "python_version": sys.version,
-        "schedule_time": SCHEDULE_TIME,
-        "headless_mode": HEADLESS_MODE,
-        "contacts_count": len(contacts),
-        "server_time": datetime.now().isoformat(),
-        "creator": "dewhush"
-    }
+    return Response(
+        content=orjson.dumps({
+            **_STATUS_STATIC,
+            "contacts_count": len(contacts),
+            "server_time": _now_iso
+        }),
+        media_type="application/json"
+    )
 
 
 # =============================================================================
 # API Endpoints - V1
 # =============================================================================
 
-@app.post("/v1/streak", tags=["Bot"], response_model=ApiResponse)
-async def run_streak(
-    background_tasks: BackgroundTasks,
-    request: RunRequest = None,
-    api_key: str = Depends(verify_api_key)
-):
+# Every /v1 route requires a valid X-API-Key header
+v1 = APIRouter(prefix="/v1", dependencies=[Depends(verify_api_key)])
+
+
+@v1.post("/streak", tags=["Bot"], responses={200: {"model": ApiResponse}})
+async def run_streak(request: RunRequest = None):
     """
     Run the streak bot.
     
@@ -254,40 +376,41 @@ async def run_streak(
     """
     custom_message = request.message if request else None
     
-    # Run bot in background
-    background_tasks.add_task(run_streak_bot, custom_message)
+    # Spawn the bot process; it keeps running after the response is sent
+    if not await run_streak_bot(custom_message):
+        raise HTTPException(status_code=500, detail="Failed to start streak bot")
     
-    return ApiResponse(
-        success=True,
-        message="Streak bot started in background",
-        data={
+    return {
+        "success": True,
+        "message": "Streak bot started in background",
+        "data": {
             "custom_message": custom_message or STREAK_MESSAGE,
             "started_at": datetime.now().isoformat()
         }
-    )
+    }
 
 
-@app.get("/v1/contacts", tags=["Contacts"], response_model=ApiResponse)
-async def list_contacts(api_key: str = Depends(verify_api_key)):
+@v1.get("/contacts", tags=["Contacts"], responses={200: {"model": ApiResponse}})
+async def list_contacts():
     """
     Get all contacts.
     
     **Requires X-API-Key header.**
     """
-    contacts = load_contacts()
+    contacts = await contacts_store.get_contacts()
     
-    return ApiResponse(
-        success=True,
-        message=f"Found {len(contacts)} contacts",
-        data={
+    return {
+        "success": True,
+        "message": f"Found {len(contacts)} contacts",
+        "data": {
             "contacts": contacts,
             "count": len(contacts)
         }
-    )
+    }
 
 
-@app.post("/v1/contacts", tags=["Contacts"], response_model=ApiResponse)
-async def add_contact(request: ContactRequest, api_key: str = Depends(verify_api_key)):
+@v1.post("/contacts", tags=["Contacts"], responses={200: {"model": ApiResponse}})
+async def add_contact(request: ContactRequest):
     """
     Add a new contact.
     
@@ -298,70 +421,66 @@ async def add_contact(request: ContactRequest, api_key: str = Depends(verify_api
     if not nickname:
         raise HTTPException(status_code=400, detail="Nickname cannot be empty")
     
-    contacts = load_contacts()
-    
-    # Check if already exists (case-insensitive)
-    if nickname.lower() in [c.lower() for c in contacts]:
+    try:
+        contacts = await contacts_store.add_contact(nickname)
+    except contacts_store.ContactExistsError:
         raise HTTPException(status_code=409, detail=f"Contact '{nickname}' already exists")
-    
-    contacts.append(nickname)
-    
-    if save_contacts(contacts):
-        return ApiResponse(
-            success=True,
-            message=f"Contact '{nickname}' added successfully",
-            data={
-                "nickname": nickname,
-                "total_contacts": len(contacts)
-            }
-        )
-    else:
+    except contacts_store.ContactSaveError:
         raise HTTPException(status_code=500, detail="Failed to save contact")
+    
+    return {
+        "success": True,
+        "message": f"Contact '{nickname}' added successfully",
+        "data": {
+            "nickname": nickname,
+            "total_contacts": len(contacts)
+        }
+    }
 
 
-@app.delete("/v1/contacts/{nickname}", tags=["Contacts"], response_model=ApiResponse)
-async def remove_contact(nickname: str, api_key: str = Depends(verify_api_key)):
+@v1.delete("/contacts/{nickname}", tags=["Contacts"], responses={200: {"model": ApiResponse}})
+async def remove_contact(nickname: str):
     """
     Remove a contact by nickname.
     
     **Requires X-API-Key header.**
     """
-    contacts = load_contacts()
-    original_count = len(contacts)
-    
-    # Remove case-insensitive
-    contacts = [c for c in contacts if c.lower() != nickname.lower()]
-    
-    if len(contacts) == original_count:
+    try:
+        contacts = await contacts_store.remove_contact(nickname)
+    except contacts_store.ContactNotFoundError:
         raise HTTPException(status_code=404, detail=f"Contact '{nickname}' not found")
-    
-    if save_contacts(contacts):
-        return ApiResponse(
-            success=True,
-            message=f"Contact '{nickname}' removed successfully",
-            data={
-                "nickname": nickname,
-                "remaining_contacts": len(contacts)
-            }
-        )
-    else:
+    except contacts_store.ContactSaveError:
         raise HTTPException(status_code=500, detail="Failed to save changes")
+    
+    return {
+        "success": True,
+        "message": f"Contact '{nickname}' removed successfully",
+        "data": {
+            "nickname": nickname,
+            "remaining_contacts": len(contacts)
+        }
+    }
+
+
+app.include_router(v1)
 
 
 # =============================================================================
 # Error Handlers
 # =============================================================================
 
+# Error body split around the message so only the message is encoded per error
+_ERROR_PREFIX = b'{"success":false,"data":null,"message":'
+_ERROR_SUFFIX = b'}'
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle all unhandled exceptions."""
-    return JSONResponse(
+    return Response(
+        content=_ERROR_PREFIX + orjson.dumps(str(exc)) + _ERROR_SUFFIX,
         status_code=500,
-        content={
-            "success": False,
-            "message": str(exc),
-            "data": None
-        }
+        media_type="application/json"
     )
 
 
@@ -374,4 +493,14 @@ if __name__ == "__main__":
     print(f"\n🚀 Starting {APP_NAME} on http://{HOST}:{PORT}")
     print(f"📚 Swagger docs: http://{HOST}:{PORT}/docs")
     print(f"📖 ReDoc: http://{HOST}:{PORT}/redoc\n")
-    uvicorn.run("api:app", host=HOST, port=PORT, reload=(APP_ENV == "development"))
+    uvicorn.run(
+        "api:app",
+        host=HOST,
+        port=PORT,
+        # uvloop isn't available on Windows; httptools is
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # reload can't be combined with multiple workers
+        reload=(APP_ENV == "development"),
+        workers=1 if APP_ENV == "development" else WORKERS,
+    )
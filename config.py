@@ -22,9 +22,13 @@ TIKTOK_LOGIN_URL = "https://www.tiktok.com/login"
 # API Settings
 # =============================================================================
 APP_NAME = os.getenv("APP_NAME", "TikTok Streak API")
+APP_VERSION = "1.0.0"
 APP_ENV = os.getenv("APP_ENV", "development")
 API_KEY = os.getenv("API_KEY", "")
 
+# Comma-separated list of allowed CORS origins ("*" allows any origin)
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
+
 # =============================================================================
 # Message Settings
 # =============================================================================
@@ -63,6 +67,10 @@ os.makedirs(LOGS_DIR, exist_ok=True)
 # =============================================================================
 HEADLESS_MODE = os.getenv("HEADLESS_MODE", "false").lower() == "true"
 
+# Chrome profile kept between runs so the TikTok login survives without
+# re-injecting cookies every time
+BROWSER_PROFILE_DIR = os.getenv("BROWSER_PROFILE_DIR", os.path.join(BASE_DIR, ".chrome_profile"))
+
 # Wait times (in seconds)
 PAGE_LOAD_WAIT = int(os.getenv("PAGE_LOAD_WAIT", "5"))
 ELEMENT_WAIT = int(os.getenv("ELEMENT_WAIT", "3"))
@@ -74,6 +82,12 @@ MESSAGE_SEND_DELAY = int(os.getenv("MESSAGE_SEND_DELAY", "2"))
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", "8000"))
 
+# Number of uvicorn worker processes (reload mode always uses one)
+WORKERS = int(os.getenv("WORKERS", "1"))
+
+# Max threads per worker for blocking work (file I/O) dispatched from async code
+THREAD_LIMIT = int(os.getenv("THREAD_LIMIT", "100"))
+
 # =============================================================================
 # Logging Settings
 # =============================================================================
@@ -0,0 +1,174 @@
+"""
+Contacts Store
+==================
+Single data path for reading and updating contacts.json from the API.
+
+Created by: dewhush
+
+The parsed file is cached in memory and only re-read when its mtime changes.
+Writes are atomic (temp file + os.replace) and skipped when nothing changed.
+Contacts are stored as {"contacts": {lowercase_nickname: nickname}} so lookups
+are O(1); the older {"contacts": [nickname, ...]} format is still read and is
+rewritten in the new format on the next change.
+Blocking file I/O runs in the threadpool so the event loop is never stalled.
+"""
+
+import os
+import asyncio
+import hashlib
+import threading
+import orjson
+from fastapi.concurrency import run_in_threadpool
+
+from config import CONTACTS_FILE
+
+
+class ContactExistsError(Exception):
+    """Raised when adding a nickname that is already in the contacts list."""
+
+
+class ContactNotFoundError(Exception):
+    """Raised when removing a nickname that is not in the contacts list."""
+
+
+class ContactSaveError(Exception):
+    """Raised when the contacts file could not be written."""
+
+
+# Parsed contacts keyed by the file's mtime, so repeated reads only cost a stat().
+# "data" maps lowercased nickname -> nickname as entered (insertion ordered).
+# "digest" is the hash of the last payload we wrote, used to skip no-op saves.
+_cache = {"mtime": None, "data": {}, "digest": None}
+_cache_lock = threading.Lock()
+
+# Serializes load -> modify -> save so concurrent edits can't overwrite each other
+_write_lock = asyncio.Lock()
+
+
+def _to_index(contacts):
+    """
+    Build the {lowercase: nickname} dict from either on-disk format.
+    
+    Keys are always rebuilt from the nicknames, so a hand-edited file with
+    mixed-case keys still matches case-insensitively.
+    """
+    if isinstance(contacts, dict):
+        contacts = contacts.values()
+    
+    index = {}
+    for nickname in contacts:
+        index.setdefault(nickname.lower(), nickname)
+    return index
+
+
+def _read_file():
+    """Read and parse the contacts file (blocking)."""
+    with open(CONTACTS_FILE, 'rb') as f:
+        data = orjson.loads(f.read())
+    return _to_index(data.get('contacts', {}))
+
+
+def _write_file(payload):
+    """Atomically replace the contacts file and return its new mtime (blocking)."""
+    tmp_file = CONTACTS_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, CONTACTS_FILE)
+    return os.stat(CONTACTS_FILE).st_mtime_ns
+
+
+async def _load_index():
+    """Load the contacts dict (cached until the file changes)."""
+    try:
+        mtime = os.stat(CONTACTS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    
+    with _cache_lock:
+        if _cache["mtime"] == mtime:
+            return _cache["data"]
+    
+    try:
+        index = await run_in_threadpool(_read_file)
+    except Exception:
+        return {}
+    
+    with _cache_lock:
+        _cache["mtime"] = mtime
+        _cache["data"] = index
+        _cache["digest"] = None
+    return index
+
+
+async def _save_index(index):
+    """Save the contacts dict to JSON file (skipped if the content is unchanged)."""
+    try:
+        payload = orjson.dumps({"contacts": index}, option=orjson.OPT_INDENT_2)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        
+        # Nothing to do if we wrote this exact content and nobody touched the file since
+        with _cache_lock:
+            if digest == _cache["digest"]:
+                try:
+                    if os.stat(CONTACTS_FILE).st_mtime_ns == _cache["mtime"]:
+                        return True
+                except FileNotFoundError:
+                    pass
+        
+        mtime = await run_in_threadpool(_write_file, payload)
+    except Exception:
+        return False
+    
+    with _cache_lock:
+        _cache["mtime"] = mtime
+        _cache["data"] = index
+        _cache["digest"] = digest
+    return True
+
+
+async def get_contacts():
+    """Get all contact nicknames, in the order they were added."""
+    return list((await _load_index()).values())
+
+
+async def add_contact(nickname):
+    """
+    Add a nickname (case-insensitive unique).
+    
+    Returns:
+        list: The updated contacts list
+    """
+    key = nickname.lower()
+    
+    async with _write_lock:
+        index = dict(await _load_index())
+        
+        if key in index:
+            raise ContactExistsError(nickname)
+        
+        index[key] = nickname
+        if not await _save_index(index):
+            raise ContactSaveError(nickname)
+    
+    return list(index.values())
+
+
+async def remove_contact(nickname):
+    """
+    Remove a nickname (case-insensitive).
+    
+    Returns:
+        list: The updated contacts list
+    """
+    key = nickname.lower()
+    
+    async with _write_lock:
+        index = dict(await _load_index())
+        
+        if index.pop(key, None) is None:
+            raise ContactNotFoundError(nickname)
+        
+        if not await _save_index(index):
+            raise ContactSaveError(nickname)
+    
+    return list(index.values())
@@ -11,17 +11,23 @@ Usage:
     python streak_bot.py --help                 # Show help
 """
 
-import json
-import sys
+import argparse
+import html
 import time
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import threading
+import unicodedata
+from collections import deque
 from DrissionPage import ChromiumPage, ChromiumOptions
+import orjson
 import schedule
-import requests
 
 from config import (
+    TIKTOK_BASE_URL,
     TIKTOK_MESSAGES_URL,
     STREAK_MESSAGE,
     SCHEDULE_TIME,
@@ -29,6 +35,7 @@ from config import (
     CONTACTS_FILE,
     LOGS_DIR,
     HEADLESS_MODE,
+    BROWSER_PROFILE_DIR,
     PAGE_LOAD_WAIT,
     ELEMENT_WAIT,
     MESSAGE_SEND_DELAY,
@@ -42,79 +49,343 @@ from config import (
 )
 
 
+# =============================================================================
+# Telegram HTTP Session
+# =============================================================================
+
+TELEGRAM_SEND_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+
+# Telegram rejects messages longer than 4096 characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Connecting should be quick; only the read side gets the caller's timeout
+TELEGRAM_CONNECT_TIMEOUT = 3.05
+
+
+def create_telegram_session():
+    """Create a pooled keep-alive session with retries for Telegram API calls."""
+    # Imported here so runs with Telegram disabled never load requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retries = Retry(
+        total=3,
+        # sendMessage isn't idempotent: never replay a POST Telegram may
+        # already have accepted
+        read=0,
+        backoff_factor=0.5,
+        # 429 is handled by telegram_send() so the rate limiter backs off too
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retries))
+    return session
+
+
+_telegram_session = None
+_telegram_session_lock = threading.Lock()
+
+
+def get_telegram_session():
+    """Return the shared Telegram session, creating it on first use."""
+    global _telegram_session
+    if _telegram_session is None:
+        with _telegram_session_lock:
+            if _telegram_session is None:
+                _telegram_session = create_telegram_session()
+    return _telegram_session
+
+
+# =============================================================================
+# Telegram Rate Limiting
+# =============================================================================
+
+class TelegramRateLimiter:
+    """
+    Thread-safe token bucket shared by every Telegram sender.
+    
+    Allows short bursts of up to `burst` messages, refills at `rate` messages
+    per second, and never lets more than `per_minute` through in any 60s window.
+    pause() holds every sender back when Telegram asks us to slow down.
+    """
+    
+    def __init__(self, rate=1.0, burst=5, per_minute=20):
+        self.rate = rate
+        self.burst = burst
+        self.per_minute = per_minute
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.sent_times = deque()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Wait until a send slot is free and take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                while self.sent_times and now - self.sent_times[0] >= 60:
+                    self.sent_times.popleft()
+                
+                if now < self.paused_until:
+                    self.tokens = 0
+                    wait = self.paused_until - now
+                elif self.tokens >= 1 and len(self.sent_times) < self.per_minute:
+                    self.tokens -= 1
+                    self.sent_times.append(now)
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0
+                    if len(self.sent_times) >= self.per_minute:
+                        wait = max(wait, 60 - (now - self.sent_times[0]))
+            
+            time.sleep(wait)
+    
+    def pause(self, seconds):
+        """Stop all sends for `seconds` and start again from an empty bucket."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+RATE_LIMITER = TelegramRateLimiter()
+
+
+def _retry_after(response):
+    """Seconds Telegram asked us to wait, from the 429 body or header."""
+    try:
+        return float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        pass
+    try:
+        return float(response.headers.get("Retry-After", 5))
+    except (TypeError, ValueError):
+        return 5.0
+
+
+def telegram_send(text, timeout=10, max_attempts=3):
+    """
+    Send one sendMessage call through the shared session and rate limiter.
+    
+    On 429 the limiter is paused for Telegram's retry_after (so every sender
+    waits) and the message is tried again.
+    
+    Returns:
+        Response of the last attempt
+    """
+    data = {
+        "chat_id": TELEGRAM_CHAT_ID,
+        "text": text,
+        "parse_mode": "HTML"
+    }
+    
+    for _ in range(max_attempts):
+        RATE_LIMITER.acquire()
+        response = get_telegram_session().post(
+            TELEGRAM_SEND_URL, data=data, timeout=(TELEGRAM_CONNECT_TIMEOUT, timeout)
+        )
+        if response.status_code != 429:
+            break
+        RATE_LIMITER.pause(_retry_after(response))
+    
+    return response
+
+
 # =============================================================================
 # Telegram Logging Handler
 # =============================================================================
 
+LOG_LEVEL_EMOJI = {
+    'DEBUG': '🔵',
+    'INFO': 'ℹ️',
+    'WARNING': '⚠️',
+    'ERROR': '❌',
+    'CRITICAL': '🚨'
+}
+DEFAULT_LOG_EMOJI = '📝'
+TELEGRAM_LOG_TEMPLATE = "{emoji} <b>{level}</b> [{time}]\n{message}"
+
+# Run notifications
+RUN_STARTED_TEMPLATE = "🚀 <b>TikTok Streak Bot Started</b>\n⏰ {time}"
+RUN_RESULT_TEMPLATE = (
+    "✅ <b>Streak Messages Sent!</b>\n\n"
+    "📊 <b>Result:</b> {sent}/{total} successful\n\n"
+    "👥 <b>Contacts:</b>\n{contacts}"
+)
+
+
 class TelegramHandler(logging.Handler):
-    """Custom logging handler that sends log messages to Telegram."""
+    """
+    Custom logging handler that sends log messages to Telegram.
     
-    def __init__(self):
-        super().__init__()
-        self.last_send_time = 0
-        self.min_interval = 1  # Minimum 1 second between messages to avoid spam
+    emit() only formats and enqueues the record; a daemon worker thread does
+    the HTTP calls so logging never blocks on Telegram, and combines records
+    that arrive close together into a single message. logging.shutdown()
+    calls flush() at exit, which gives queued messages a chance to go out.
+    """
+    
+    def __init__(self, level=TELEGRAM_LOG_LEVEL, max_queue=1000, flush_timeout=10, batch_wait=0.5, batch_chars=3500):
+        # Records below the level are dropped by logging before emit() is called
+        super().__init__(level)
+        self.flush_timeout = flush_timeout
+        self.batch_wait = batch_wait
+        self.batch_chars = batch_chars  # Telegram's limit is 4096, leave headroom
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._carry = None
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
         
-    def emit(self, record):
-        """Send log record to Telegram."""
-        if not TELEGRAM_ENABLED or not TELEGRAM_LOG_ENABLED:
-            return
+        # Our own HTTP stack logs retry warnings when Telegram is unreachable;
+        # forwarding those to Telegram would feed back into more failed sends
+        self.addFilter(lambda record: not record.name.startswith(("urllib3", "requests")))
         
-        if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-            return
+        self.worker = threading.Thread(target=self._worker, name="TelegramHandler", daemon=True)
+        self.worker.start()
         
+    def emit(self, record):
+        """Queue log record for sending to Telegram."""
         try:
-            # Rate limiting
-            current_time = time.time()
-            if current_time - self.last_send_time < self.min_interval:
-                return
-            
             # Format message with emoji based on log level
-            emoji_map = {
-                'DEBUG': '🔵',
-                'INFO': 'ℹ️',
-                'WARNING': '⚠️',
-                'ERROR': '❌',
-                'CRITICAL': '🚨'
-            }
-            
-            emoji = emoji_map.get(record.levelname, '📝')
-            timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
-            
-            # Format message
-            message = f"{emoji} <b>{record.levelname}</b> [{timestamp}]\n{record.getMessage()}"
-            
-            # Send to Telegram
-            url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-            data = {
-                "chat_id": TELEGRAM_CHAT_ID,
-                "text": message,
-                "parse_mode": "HTML"
-            }
-            
-            requests.post(url, data=data, timeout=5)
-            self.last_send_time = current_time
+            message = TELEGRAM_LOG_TEMPLATE.format(
+                emoji=LOG_LEVEL_EMOJI.get(record.levelname, DEFAULT_LOG_EMOJI),
+                level=record.levelname,
+                time=time.strftime('%H:%M:%S', time.localtime(record.created)),
+                # Batches are sent as HTML; one stray "<" would get the whole batch rejected
+                message=html.escape(record.getMessage()),
+            )
+            
+            self.queue.put_nowait(message)
             
+        except queue.Full:
+            # Drop rather than block the caller when Telegram can't keep up,
+            # but count it so the next batch can report the loss
+            with self._dropped_lock:
+                self._dropped += 1
         except Exception:
             # Silently fail - don't want logging errors to crash the app
             pass
+    
+    def _next_batch(self):
+        """
+        Collect queued messages into one Telegram-sized batch.
+        
+        Waits up to batch_wait seconds after the first message for more to
+        arrive. A message that would push the batch past batch_chars is held
+        over for the next batch.
+        """
+        if self._carry is not None:
+            messages = [self._carry]
+            self._carry = None
+        else:
+            messages = [self.queue.get()]
+        
+        size = len(messages[0])
+        deadline = time.monotonic() + self.batch_wait
+        
+        while size < self.batch_chars:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                message = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            
+            if size + len(message) + 2 > self.batch_chars:
+                self._carry = message
+                break
+            
+            messages.append(message)
+            size += len(message) + 2
+        
+        return messages
+    
+    def _worker(self):
+        """Send queued messages to Telegram, batching bursts into one message."""
+        while True:
+            messages = self._next_batch()
+            try:
+                with self._dropped_lock:
+                    dropped, self._dropped = self._dropped, 0
+                
+                lines = messages
+                if dropped:
+                    lines = [f"⚠️ <b>DROPPED</b> {dropped} log messages"] + messages
+                
+                # A single oversized record can still exceed Telegram's limit
+                for piece in split_message("\n\n".join(lines)):
+                    telegram_send(piece, timeout=5)
+                
+            except Exception:
+                pass
+            finally:
+                for _ in messages:
+                    self.queue.task_done()
+    
+    def flush(self):
+        """Wait (up to flush_timeout seconds) for queued messages to be sent."""
+        deadline = time.time() + self.flush_timeout
+        while self.queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.1)
+
+
+class DailyFileHandler(logging.FileHandler):
+    """
+    Append to logs/streak_bot_YYYYMMDD.log, switching files when the date changes.
+    
+    Nothing is ever renamed, so the scheduler and API-spawned runs can share
+    the logs directory without clobbering each other's files.
+    """
+    
+    def __init__(self, directory, prefix="streak_bot"):
+        self.directory = directory
+        self.prefix = prefix
+        self.current_date = time.strftime('%Y%m%d')
+        super().__init__(self._path(), encoding='utf-8', delay=True)
+    
+    def _path(self):
+        """Return the absolute log path for the current date."""
+        return os.path.abspath(os.path.join(self.directory, f"{self.prefix}_{self.current_date}.log"))
+    
+    def emit(self, record):
+        date = time.strftime('%Y%m%d', time.localtime(record.created))
+        if date != self.current_date:
+            # FileHandler.emit reopens the stream at the new path
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            self.current_date = date
+            self.baseFilename = self._path()
+        super().emit(record)
 
 
 # Set up logging
 def setup_logging():
     """Configure logging to file, console, and Telegram."""
-    log_filename = os.path.join(LOGS_DIR, f"streak_bot_{datetime.now().strftime('%Y%m%d')}.log")
+    # One file per day so a long-running scheduler doesn't keep writing to
+    # one file forever
+    file_handler = DailyFileHandler(LOGS_DIR)
+    
+    # Buffer file writes: flushed every 256 records, on ERROR, and at exit
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+    file_buffer = logging.handlers.MemoryHandler(256, flushLevel=logging.ERROR, target=file_handler)
     
     # Create handlers list
     handlers = [
-        logging.FileHandler(log_filename, encoding='utf-8'),
+        file_buffer,
         logging.StreamHandler()
     ]
     
-    # Add Telegram handler if enabled
-    if TELEGRAM_ENABLED and TELEGRAM_LOG_ENABLED:
-        telegram_handler = TelegramHandler()
-        telegram_handler.setLevel(TELEGRAM_LOG_LEVEL)
-        handlers.append(telegram_handler)
+    # Add Telegram handler only if enabled and configured
+    if TELEGRAM_ENABLED and TELEGRAM_LOG_ENABLED and TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+        handlers.append(TelegramHandler())
     
     logging.basicConfig(
         level=logging.INFO,
@@ -122,29 +393,42 @@ def setup_logging():
         datefmt=LOG_DATE_FORMAT,
         handlers=handlers
     )
-    return logging.getLogger(__name__)
+    return logging.getLogger(__name__), file_buffer
 
 
-logger = setup_logging()
+logger, FILE_LOG_BUFFER = setup_logging()
 
 
-def send_telegram(message):
-    """Send a message to Telegram."""
-    if not TELEGRAM_ENABLED:
-        return False
+def split_message(text, limit=TELEGRAM_MESSAGE_LIMIT):
+    """
+    Split text into pieces Telegram will accept.
     
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        logger.debug("Telegram not configured (missing token or chat_id)")
-        return False
+    Breaks at the last newline that fits (so HTML tags on a line stay whole),
+    and only cuts mid-line when a single line is longer than the limit.
     
+    Returns:
+        list: Pieces of at most `limit` characters
+    """
+    pieces = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit + 1)
+        if cut <= 0:
+            cut = limit
+            # Don't cut through an escaped entity such as &amp;
+            amp = text.rfind("&", cut - 8, cut)
+            if amp > 0 and ";" not in text[amp:cut]:
+                cut = amp
+        pieces.append(text[:cut])
+        text = text[cut:].lstrip("\n")
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def _post_telegram(message):
+    """Send a message to Telegram (blocking)."""
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        data = {
-            "chat_id": TELEGRAM_CHAT_ID,
-            "text": message,
-            "parse_mode": "HTML"
-        }
-        response = requests.post(url, data=data, timeout=10)
+        response = telegram_send(message)
         
         if response.status_code == 200:
             logger.debug("Telegram notification sent successfully")
@@ -158,6 +442,179 @@ def send_telegram(message):
         return False
 
 
+# Notifications are delivered in order by one background thread, so the bot
+# never waits on Telegram between browser steps
+NOTIFY_QUEUE = queue.Queue(maxsize=100)
+_notify_worker = None
+_notify_worker_lock = threading.Lock()
+
+
+def _notify_worker_loop():
+    """Send queued notifications one by one."""
+    while True:
+        message = NOTIFY_QUEUE.get()
+        try:
+            _post_telegram(message)
+        finally:
+            NOTIFY_QUEUE.task_done()
+
+
+def send_telegram(message):
+    """
+    Queue a message for Telegram.
+    
+    Returns:
+        bool: True if the message was queued
+    """
+    global _notify_worker
+    
+    if not TELEGRAM_ENABLED:
+        return False
+    
+    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+        logger.debug("Telegram not configured (missing token or chat_id)")
+        return False
+    
+    if _notify_worker is None:
+        with _notify_worker_lock:
+            if _notify_worker is None:
+                _notify_worker = threading.Thread(target=_notify_worker_loop, name="TelegramNotify", daemon=True)
+                _notify_worker.start()
+    
+    try:
+        NOTIFY_QUEUE.put_nowait(message)
+        return True
+    except queue.Full:
+        logger.warning("Telegram notification queue full, dropping message")
+        return False
+
+
+def flush_telegram(timeout=10):
+    """Wait (up to timeout seconds) for queued notifications to be sent."""
+    deadline = time.time() + timeout
+    while NOTIFY_QUEUE.unfinished_tasks and time.time() < deadline:
+        time.sleep(0.1)
+
+
+# Deliver pending notifications before the interpreter exits
+atexit.register(flush_telegram)
+
+
+# =============================================================================
+# JSON File Cache
+# =============================================================================
+
+# path -> ((mtime_ns, size), parsed data); scheduled runs reuse the parse
+# until the file changes
+_json_cache = {}
+
+
+def load_json_cached(path):
+    """Load and parse a JSON file, reusing the last result if it hasn't changed."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    
+    cached = _json_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    _json_cache[path] = (key, data)
+    return data
+
+
+# Browser-extension exports use these sameSite values; CDP wants Strict/Lax/None
+_SAME_SITE = {'no_restriction': 'None', 'none': 'None', 'lax': 'Lax', 'strict': 'Strict'}
+
+
+def to_cdp_cookie(cookie):
+    """Convert an exported cookie dict into a CDP Network.CookieParam."""
+    param = {'name': cookie['name'], 'value': cookie['value']}
+    
+    for key in ('domain', 'path', 'secure', 'httpOnly'):
+        if key in cookie:
+            param[key] = cookie[key]
+    if 'domain' not in param:
+        param['url'] = TIKTOK_BASE_URL
+    
+    expires = cookie.get('expires', cookie.get('expirationDate'))
+    if expires and expires > 0 and not cookie.get('session'):
+        param['expires'] = float(expires)
+    
+    same_site = _SAME_SITE.get(str(cookie.get('sameSite', '')).lower())
+    if same_site:
+        param['sameSite'] = same_site
+    
+    return param
+
+
+def normalize_nickname(text):
+    """Comparison key for a nickname: NFKC-normalized and casefolded."""
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+# Selectors for the nickname text in the conversation list
+NICKNAME_SELECTORS = (
+    'p[class*="PInfoNickname"]',
+    'p[class*="Nickname"]',
+    'span[class*="Nickname"]',
+    'div[class*="Nickname"]',
+)
+
+# Selectors for the message input of an open conversation
+MESSAGE_INPUT_SELECTORS = (
+    'div[data-e2e="message-input"]',
+    'div[contenteditable="true"]',
+    'textarea[placeholder*="message"]',
+    'input[placeholder*="message"]',
+    'div[class*="Input"] div[contenteditable="true"]',
+)
+
+# Send button of an open conversation
+SEND_BUTTON_SELECTOR = 'css:button[data-e2e="send-button"], button[class*="send"], button[class*="Send"]'
+
+# "Maybe later" button of TikTok's passkey popup, reverse engineered from
+# the actual DOM, most specific first
+PASSKEY_DISMISS_SELECTORS = (
+    # Exact class match for TikTok secondary button
+    'css:button.TUXButton--secondary',
+    'css:button.TUXButton.TUXButton--secondary',
+    
+    # Text-based (most reliable)
+    'xpath://button[.//div[contains(text(), "Maybe later")]]',
+    'xpath://button[contains(., "Maybe later")]',
+    'xpath://div[contains(@class, "TUXButton-label") and text()="Maybe later"]/ancestor::button',
+    
+    # Class combinations
+    'css:button[class*="TUXButton"][class*="secondary"]',
+    'css:button[class*="secondary"][aria-disabled="false"]',
+    
+    # Generic fallbacks
+    'xpath://button[contains(text(), "Maybe later")]',
+    'xpath://button[contains(text(), "maybe later")]',
+    'xpath://span[contains(text(), "Maybe later")]/parent::button',
+    'css:button[aria-label*="Maybe later"]',
+)
+
+# Combined (comma-union) queries: one browser round-trip and one timeout
+NICKNAME_SELECTOR = 'css:' + ', '.join(NICKNAME_SELECTORS)
+MESSAGE_INPUT_SELECTOR = 'css:' + ', '.join(MESSAGE_INPUT_SELECTORS)
+
+# Requests the browser never needs to make (TikTok's UI still needs its scripts)
+BLOCKED_URL_PATTERNS = (
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.avif',
+    '*.mp4', '*.webm', '*/video/*',
+    '*.woff', '*.woff2', '*.ttf',
+)
+
+# Nearest ancestor that looks like a clickable conversation item
+CONVERSATION_CONTAINER_XPATH = (
+    'xpath:./ancestor::*[contains(@class, "Item") or contains(@class, "item") '
+    'or contains(@class, "Container")][1]'
+)
+
+
 class TikTokStreakBot:
     """Bot to automatically send streak messages on TikTok."""
     
@@ -176,6 +633,13 @@ class TikTokStreakBot:
         self.custom_message = custom_message
         self.target_usernames = []
         self.contacts_found = []
+        
+        # Lookup caches, valid until the page is reloaded
+        self._contact_elements = {}
+        self._contact_locators = {}  # normalized nickname -> xpath, survives reloads
+        
+        # Telegram notifications for this run, sent together when it ends
+        self._notifications = []
     
     def load_target_contacts(self):
         """Load target usernames from contacts.json file."""
@@ -185,30 +649,37 @@ class TikTokStreakBot:
             return False
         
         try:
-            with open(CONTACTS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_cached(CONTACTS_FILE)
+            
+            contacts = data.get('contacts', [])
             
-            self.target_usernames = data.get('contacts', [])
+            # API stores {lowercase: nickname}; a plain list is also accepted
+            if isinstance(contacts, dict):
+                contacts = list(contacts.values())
+            
+            self.target_usernames = contacts
             
             if not self.target_usernames:
                 logger.warning("No contacts found in contacts.json")
                 return False
             
-            logger.info(f"📋 Loaded {len(self.target_usernames)} target contacts:")
-            for username in self.target_usernames:
-                logger.info(f"   - {username}")
+            logger.info(
+                "📋 Loaded %d target contacts:\n%s",
+                len(self.target_usernames),
+                "\n".join("   - " + username for username in self.target_usernames),
+            )
             
             return True
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             error_msg = f"Invalid JSON in contacts.json: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Config Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Config Error</b>\n{html.escape(error_msg)}")
             return False
         except Exception as e:
             error_msg = f"Error loading contacts: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Contact Load Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Contact Load Error</b>\n{html.escape(error_msg)}")
             return False
     
     def create_browser(self):
@@ -232,36 +703,67 @@ class TikTokStreakBot:
                 '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
             
+            # Reuse the saved profile so an existing TikTok login carries over
+            options.set_user_data_path(BROWSER_PROFILE_DIR)
+            
+            # Return from page.get() once the DOM is ready, not after every asset
+            options.set_load_mode('eager')
+            
             self.page = ChromiumPage(options)
+            
+            # Skip images, video and fonts - the bot only needs the DOM and scripts
+            try:
+                self.page.run_cdp('Network.enable')
+                self.page.run_cdp('Network.setBlockedURLs', urls=list(BLOCKED_URL_PATTERNS))
+            except Exception as e:
+                logger.debug("Could not block media requests: %s", e)
             logger.info("Browser initialized successfully")
             return self.page
         except Exception as e:
             error_msg = f"Error creating browser: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Browser Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Browser Error</b>\n{html.escape(error_msg)}")
             raise
     
     def load_cookies(self):
         """Load cookies from file and apply to browser."""
+        # The saved browser profile is usually still logged in; only inject
+        # cookies when it isn't
+        try:
+            self.page.get(TIKTOK_MESSAGES_URL)
+            self.page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT)
+            # The login redirect happens after the eager load returns, so only
+            # trust the URL once the contact list has rendered
+            logged_in = self.page.wait.ele_displayed(NICKNAME_SELECTOR, timeout=PAGE_LOAD_WAIT)
+            if logged_in and 'messages' in self.page.url and 'login' not in self.page.url:
+                logger.info("Already logged in from saved browser profile")
+                return True
+        except Exception as e:
+            logger.debug(f"Profile login check failed: {e}")
+        
         if not os.path.exists(COOKIES_FILE):
             logger.error(f"Cookies file not found: {COOKIES_FILE}")
             logger.error("Please export your TikTok cookies to cookies.json")
             return False
         
         try:
-            with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
-                cookies = json.load(f)
+            cookies = load_json_cached(COOKIES_FILE)
             
             # Navigate to TikTok first (cookies need a domain)
             self.page.get("https://www.tiktok.com")
-            time.sleep(2)
+            self.page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT)
             
-            # Add cookies
-            for cookie in cookies:
-                try:
-                    self.page.set.cookies(cookie)
-                except Exception as e:
-                    logger.debug(f"Skipped cookie {cookie.get('name')}: {e}")
+            # Add cookies with a single CDP command; fall back to one at a time
+            # so a single bad cookie doesn't stop the rest from being applied
+            try:
+                self.page.run_cdp('Network.setCookies', cookies=[to_cdp_cookie(c) for c in cookies])
+            except Exception as e:
+                logger.debug(f"Bulk cookie load failed, adding one by one: {e}")
+                for cookie in cookies:
+                    try:
+                        self.page.set.cookies(cookie)
+                    except Exception as e:
+                        logger.debug("Skipped cookie %s: %s", cookie.get('name'), e)
             
             logger.info(f"Loaded {len(cookies)} cookies")
             return True
@@ -269,14 +771,19 @@ class TikTokStreakBot:
         except Exception as e:
             error_msg = f"Error loading cookies: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Cookie Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Cookie Error</b>\n{html.escape(error_msg)}")
             return False
     
     def verify_login(self):
         """Verify that we're logged in by checking the messages page."""
         try:
-            self.page.get(TIKTOK_MESSAGES_URL)
-            time.sleep(PAGE_LOAD_WAIT)
+            # load_cookies may have left us on the messages page already
+            if 'messages' not in self.page.url:
+                self.page.get(TIKTOK_MESSAGES_URL)
+                self.page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT)
+            # Give a pending login redirect time to happen before reading the URL
+            self.page.wait.ele_displayed(NICKNAME_SELECTOR, timeout=PAGE_LOAD_WAIT)
+            self._clear_lookup_cache()
             
             current_url = self.page.url
             
@@ -291,65 +798,45 @@ class TikTokStreakBot:
                 # Handle "Maybe later" popup if it appears (Passkey modal)
                 try:
                     logger.info("Checking for popups...")
-                    time.sleep(3)  # Wait for potential popup to appear
+                    # Wait for potential popup to appear (returns as soon as it does)
+                    popup_shown = self.page.wait.ele_displayed('css:div[role="dialog"], div[class*="TUXModal"]', timeout=3)
                     
                     # Strategy 1: Try to find and close passkey modal
                     # Using reverse engineering - detect modal by class and role attributes
                     logger.debug("Strategy 1: Detecting modal by TUXModal class...")
                     modal_detected = False
                     
-                    try:
-                        # Check if modal exists by class name
-                        modal = self.page.ele('css:div[class*="TUXModal"]', timeout=2)
-                        if modal:
-                            logger.info("✅ Passkey modal detected!")
-                            modal_detected = True
-                    except:
-                        logger.debug("No TUXModal found")
-                    
-                    # Also check by role=dialog
-                    if not modal_detected:
+                    if popup_shown:
                         try:
-                            modal = self.page.ele('css:div[role="dialog"]', timeout=2)
+                            # Check if modal exists by class name
+                            modal = self.page.ele('css:div[class*="TUXModal"]', timeout=2)
                             if modal:
-                                # Check if it contains passkey text
-                                modal_text = modal.text.lower() if modal.text else ""
-                                if "passkey" in modal_text or "create a passkey" in modal_text:
-                                    logger.info("✅ Passkey dialog detected by role!")
-                                    modal_detected = True
+                                logger.info("✅ Passkey modal detected!")
+                                modal_detected = True
                         except:
-                            logger.debug("No dialog modal found")
+                            logger.debug("No TUXModal found")
+                        
+                        # Also check by role=dialog
+                        if not modal_detected:
+                            try:
+                                modal = self.page.ele('css:div[role="dialog"]', timeout=2)
+                                if modal:
+                                    # Check if it contains passkey text
+                                    modal_text = modal.text.lower() if modal.text else ""
+                                    if "passkey" in modal_text or "create a passkey" in modal_text:
+                                        logger.info("✅ Passkey dialog detected by role!")
+                                        modal_detected = True
+                            except:
+                                logger.debug("No dialog modal found")
                     
                     # Strategy 2: If modal detected, find and click "Maybe later" button
                     if modal_detected:
                         logger.info("Attempting to dismiss passkey popup...")
                         
-                        # Reverse engineered selectors based on actual TikTok DOM
-                        maybe_later_selectors = [
-                            # Exact class match for TikTok secondary button
-                            'css:button.TUXButton--secondary',
-                            'css:button.TUXButton.TUXButton--secondary',
-                            
-                            # Text-based (most reliable)
-                            'xpath://button[.//div[contains(text(), "Maybe later")]]',
-                            'xpath://button[contains(., "Maybe later")]',
-                            'xpath://div[contains(@class, "TUXButton-label") and text()="Maybe later"]/ancestor::button',
-                            
-                            # Class combinations
-                            'css:button[class*="TUXButton"][class*="secondary"]',
-                            'css:button[class*="secondary"][aria-disabled="false"]',
-                            
-                            # Generic fallbacks
-                            'xpath://button[contains(text(), "Maybe later")]',
-                            'xpath://button[contains(text(), "maybe later")]',
-                            'xpath://span[contains(text(), "Maybe later")]/parent::button',
-                            'css:button[aria-label*="Maybe later"]',
-                        ]
-                        
                         dismissed = False
-                        for selector in maybe_later_selectors:
+                        for selector in PASSKEY_DISMISS_SELECTORS:
                             try:
-                                logger.debug(f"Trying selector: {selector}")
+                                logger.debug("Trying selector: %s", selector)
                                 button = self.page.ele(selector, timeout=2)
                                 if button:
                                     logger.info(f"✅ Found 'Maybe later' button with: {selector}")
@@ -365,11 +852,12 @@ class TikTokStreakBot:
                                         self.page.run_js("arguments[0].click();", button)
                                         dismissed = True
                                     
-                                    time.sleep(1.5)
+                                    # Wait for the popup to close rather than a fixed delay
+                                    self.page.wait.ele_deleted(button, timeout=1.5)
                                     logger.info("✅ Passkey popup dismissed successfully!")
                                     break
                             except Exception as e:
-                                logger.debug(f"Selector {selector} failed: {e}")
+                                logger.debug("Selector %s failed: %s", selector, e)
                                 continue
                         
                         if not dismissed:
@@ -388,7 +876,7 @@ class TikTokStreakBot:
         except Exception as e:
             error_msg = f"Error verifying login: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Login Verification Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Login Verification Error</b>\n{html.escape(error_msg)}")
             return False
     
     def find_target_contacts(self):
@@ -397,82 +885,75 @@ class TikTokStreakBot:
         
         try:
             # Wait for conversation list to load
-            time.sleep(ELEMENT_WAIT + 3)
+            self.page.wait.ele_displayed(NICKNAME_SELECTOR, timeout=ELEMENT_WAIT + 3)
             
             logger.info("Searching for contacts using TikTok nickname elements...")
             
-            # First, try to find nickname elements using the specific TikTok class
-            nickname_selectors = [
-                'css:p[class*="PInfoNickname"]',
-                'css:p[class*="Nickname"]',
-                'css:span[class*="Nickname"]',
-                'css:div[class*="Nickname"]',
-            ]
-            
-            for target in self.target_usernames:
-                found = False
+            # Query the nicknames once and index them, instead of
+            # re-scanning the whole list for every target
+            nickname_index = {}
+            available_nicknames = []
+            pending = {normalize_nickname(target) for target in self.target_usernames}
+            try:
+                nickname_elements = self.page.eles(NICKNAME_SELECTOR)
+                logger.info(f"Found {len(nickname_elements)} nickname elements")
                 
-                # Try each nickname selector
-                for selector in nickname_selectors:
-                    if found:
-                        break
+                for elem in nickname_elements:
                     try:
-                        nickname_elements = self.page.eles(selector)
-                        logger.info(f"Found {len(nickname_elements)} elements with selector: {selector}")
+                        elem_text = elem.text.strip() if elem.text else ""
+                        logger.debug("  Checking nickname: '%s'", elem_text)
+                        key = normalize_nickname(elem_text)
+                        if elem_text and key not in nickname_index:
+                            nickname_index[key] = elem
+                            available_nicknames.append(elem_text)
                         
-                        for elem in nickname_elements:
-                            try:
-                                elem_text = elem.text.strip() if elem.text else ""
-                                logger.debug(f"  Checking nickname: '{elem_text}'")
-                                
-                                # Case-insensitive match
-                                if elem_text.lower() == target.lower():
-                                    # Find parent container to click
-                                    parent = elem
-                                    for _ in range(10):
-                                        try:
-                                            parent = parent.parent()
-                                            if parent:
-                                                parent_class = parent.attr('class') or ''
-                                                # Look for conversation container
-                                                if 'Item' in parent_class or 'item' in parent_class or 'Container' in parent_class:
-                                                    self.contacts_found.append({
-                                                        'element': parent,
-                                                        'username': target,
-                                                        'nickname_element': elem,
-                                                        'index': len(self.contacts_found)
-                                                    })
-                                                    logger.info(f"✅ Found target contact: {target}")
-                                                    found = True
-                                                    break
-                                        except Exception as e:
-                                            logger.debug(f"Error finding parent: {e}")
-                                            continue
-                                    
-                                    # If we couldn't find a good parent, use the element itself
-                                    if not found:
-                                        self.contacts_found.append({
-                                            'element': elem,
-                                            'username': target,
-                                            'nickname_element': elem,
-                                            'index': len(self.contacts_found)
-                                        })
-                                        logger.info(f"✅ Found target (using element directly): {target}")
-                                        found = True
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Error checking element: {e}")
-                                continue
+                        # Every element read is a browser round-trip; stop once
+                        # all targets are matched
+                        pending.discard(key)
+                        if not pending:
+                            break
                     except Exception as e:
-                        logger.debug(f"Error with selector {selector}: {e}")
+                        logger.debug("Error checking element: %s", e)
                         continue
+            except Exception as e:
+                logger.debug(f"Error with selector {NICKNAME_SELECTOR}: {e}")
+            
+            missing = []
+            for target in self.target_usernames:
+                elem = nickname_index.get(normalize_nickname(target))
                 
-                # If still not found, try text search
-                if not found:
-                    try:
-                        elem = self.page.ele(f'xpath://*[text()="{target}"]')
-                        if not elem:
-                            elem = self.page.ele(f'xpath://*[contains(text(), "{target}")]')
+                if elem:
+                    # Find parent container to click
+                    parent = self._find_conversation_container(elem)
+                    
+                    if parent:
+                        logger.info("✅ Found target contact: %s", target)
+                    else:
+                        # If we couldn't find a good parent, use the element itself
+                        parent = elem
+                        logger.info("✅ Found target (using element directly): %s", target)
+                    
+                    self.contacts_found.append({
+                        'element': parent,
+                        'username': target,
+                        'nickname_element': elem,
+                        'index': len(self.contacts_found)
+                    })
+                    self._remember_contact(target, parent)
+                else:
+                    missing.append(target)
+            
+            # If still not found, try text search - one query for all misses,
+            # preferring an exact text match over a partial one
+            if missing:
+                try:
+                    union = ' | '.join(f'//*[contains(text(), "{t}")]' for t in missing if '"' not in t)
+                    candidates = self.page.eles(f'xpath:{union}', timeout=2) if union else []
+                    candidate_texts = [(elem, (elem.text or '').strip()) for elem in candidates]
+                    
+                    for target in missing:
+                        exact = next((elem for elem, text in candidate_texts if text == target), None)
+                        elem = exact or next((elem for elem, text in candidate_texts if target in text), None)
                         
                         if elem:
                             self.contacts_found.append({
@@ -480,26 +961,20 @@ class TikTokStreakBot:
                                 'username': target,
                                 'index': len(self.contacts_found)
                             })
-                            logger.info(f"✅ Found via text search: {target}")
-                    except:
-                        pass
+                            logger.info("✅ Found via text search: %s", target)
+                except Exception as e:
+                    logger.debug(f"Text search failed: {e}")
             
             # Report results
-            found_usernames = {c['username'].lower() for c in self.contacts_found}
-            not_found = [u for u in self.target_usernames if u.lower() not in found_usernames]
+            found_usernames = {normalize_nickname(c['username']) for c in self.contacts_found}
+            not_found = [u for u in self.target_usernames if normalize_nickname(u) not in found_usernames]
             
             if not_found:
                 logger.warning(f"⚠️ Could not find these contacts: {', '.join(not_found)}")
-                # Show available nicknames for debugging
-                logger.info("Available nicknames on this page:")
-                try:
-                    for selector in nickname_selectors:
-                        elements = self.page.eles(selector)
-                        for elem in elements[:10]:
-                            if elem.text:
-                                logger.info(f"  - {elem.text.strip()}")
-                except:
-                    pass
+                # Show available nicknames for debugging (already collected above)
+                if logger.isEnabledFor(logging.DEBUG):
+                    nickname_lines = "\n".join(f"  - {nickname}" for nickname in available_nicknames[:10])
+                    logger.debug(f"Available nicknames on this page:\n{nickname_lines}")
             
             logger.info(f"📊 Found {len(self.contacts_found)}/{len(self.target_usernames)} target contacts")
             return self.contacts_found
@@ -507,7 +982,7 @@ class TikTokStreakBot:
         except Exception as e:
             error_msg = f"Error finding contacts: {e}"
             logger.error(error_msg)
-            send_telegram(f"❌ <b>Contact Search Error</b>\n{error_msg}")
+            self._notify(f"❌ <b>Contact Search Error</b>\n{html.escape(error_msg)}")
             return []
     
     def send_message(self, contact):
@@ -523,10 +998,11 @@ class TikTokStreakBot:
         """
         username = contact.get('username', 'Unknown')
         max_retries = 3
+        refreshed = False
         
         for attempt in range(1, max_retries + 1):
             try:
-                logger.info(f"📤 Sending message to: {username} (Attempt {attempt}/{max_retries})")
+                logger.info("📤 Sending message to: %s (Attempt %d/%d)", username, attempt, max_retries)
                 
                 # Strategy 1: Re-find by nickname with multiple selectors
                 contact_element = self._find_contact_element(username)
@@ -539,17 +1015,24 @@ class TikTokStreakBot:
                     time.sleep(1)
                     contact_element = self._find_contact_element(username)
                 
-                if not contact_element:
+                # Full reload is expensive, so only do it once per contact
+                if not contact_element and not refreshed:
                     logger.warning(f"Strategy 2 failed for {username}, trying strategy 3...")
                     
                     # Strategy 3: Refresh message list and retry
+                    refreshed = True
                     self.page.refresh()
-                    time.sleep(PAGE_LOAD_WAIT)
+                    self._clear_lookup_cache()
+                    self.page.wait.doc_loaded(timeout=PAGE_LOAD_WAIT)
                     contact_element = self._find_contact_element(username)
                 
                 if not contact_element:
                     raise Exception(f"Could not find contact element after all strategies")
                 
+                # Input box of the conversation that is open now (if any), so we
+                # can tell when it has been replaced by the new one
+                previous_input = self.page.ele(MESSAGE_INPUT_SELECTOR, timeout=0)
+                
                 # Click on the conversation to open it
                 logger.debug(f"Clicking on contact: {username}")
                 try:
@@ -559,7 +1042,12 @@ class TikTokStreakBot:
                     logger.debug("Normal click failed, trying JS click...")
                     self.page.run_js(f"arguments[0].click();", contact_element)
                 
-                time.sleep(ELEMENT_WAIT)
+                # Wait for the previous chat's input to go away before looking for
+                # ours, otherwise we could type into the old conversation. If the
+                # page reuses the same node, this falls back to the old fixed delay.
+                if previous_input:
+                    self.page.wait.ele_deleted(previous_input, timeout=ELEMENT_WAIT)
+                self.page.wait.ele_displayed(MESSAGE_INPUT_SELECTOR, timeout=ELEMENT_WAIT)
                 
                 # Find the message input field with multiple attempts
                 input_field = self._find_message_input()
@@ -569,15 +1057,13 @@ class TikTokStreakBot:
                 
                 # Click on input field to focus
                 input_field.click()
-                time.sleep(0.5)
                 
                 # Type the message
                 message_to_send = self.custom_message if self.custom_message else STREAK_MESSAGE
                 input_field.input(message_to_send)
-                time.sleep(0.5)
                 
-                # Find and click send button, or press Enter
-                send_button = self.page.ele('css:button[data-e2e="send-button"], button[class*="send"], button[class*="Send"]')
+                # Find and click send button (returns as soon as it shows up), or press Enter
+                send_button = self.page.ele(SEND_BUTTON_SELECTOR, timeout=2)
                 
                 if send_button:
                     send_button.click()
@@ -588,12 +1074,15 @@ class TikTokStreakBot:
                 
                 time.sleep(MESSAGE_SEND_DELAY)
                 
-                logger.info(f"✅ Message sent to: {username}")
+                logger.info("✅ Message sent to: %s", username)
                 return True
                 
             except Exception as e:
                 logger.warning(f"Attempt {attempt} failed for {username}: {e}")
                 
+                # The cached element may be stale; look it up fresh next time
+                self._contact_elements.pop(normalize_nickname(username), None)
+                
                 if attempt < max_retries:
                     logger.info(f"Retrying in 2 seconds...")
                     time.sleep(2)
@@ -601,11 +1090,63 @@ class TikTokStreakBot:
                     # All retries exhausted
                     error_msg = f"Failed to send to {username} after {max_retries} attempts: {e}"
                     logger.error(error_msg)
-                    send_telegram(f"❌ <b>Message Send Error</b>\nFailed to send to: {username}\nError: {str(e)}\nRetries: {max_retries}")
+                    self._notify(f"❌ <b>Message Send Error</b>\nFailed to send to: {html.escape(username)}\nError: {html.escape(str(e))}\nRetries: {max_retries}")
                     return False
         
         return False
     
+    def _clear_lookup_cache(self):
+        """Forget cached elements after the page has been (re)loaded."""
+        self._contact_elements.clear()
+    
+    def _remember_contact(self, username, element):
+        """Cache a contact's conversation element and its xpath for later sends."""
+        key = normalize_nickname(username)
+        self._contact_elements[key] = element
+        try:
+            self._contact_locators[key] = element.xpath
+        except Exception as e:
+            logger.debug(f"Could not read xpath for {username}: {e}")
+    
+    def _shows_nickname(self, element, key):
+        """
+        Check that a conversation element belongs to the given contact.
+        
+        Compares the element's nickname child (or the element itself, if it is
+        the nickname) for equality, so previews and longer nicknames that merely
+        contain the name don't match.
+        
+        Args:
+            element: Conversation item or nickname element
+            key: normalize_nickname() of the contact
+        
+        Returns:
+            bool: True if the nickname matches exactly
+        """
+        try:
+            nickname = element.ele(NICKNAME_SELECTOR, timeout=0.5)
+            text = nickname.text if nickname else element.text
+            return normalize_nickname((text or '').strip()) == key
+        except Exception as e:
+            logger.debug("Nickname check failed: %s", e)
+            return False
+    
+    def _find_conversation_container(self, elem):
+        """
+        Find the clickable conversation item that contains a nickname element.
+        
+        Uses a single XPath ancestor query, so the nearest matching container
+        is resolved in the browser in one round-trip.
+        
+        Returns:
+            Element if found, None otherwise
+        """
+        try:
+            return elem.ele(CONVERSATION_CONTAINER_XPATH, timeout=1)
+        except Exception as e:
+            logger.debug("Error finding parent: %s", e)
+            return None
+    
     def _find_contact_element(self, username):
         """
         Find contact element by username with multiple strategies.
@@ -616,35 +1157,46 @@ class TikTokStreakBot:
         Returns:
             Element if found, None otherwise
         """
-        logger.debug(f"Finding contact element for: {username}")
+        logger.debug("Finding contact element for: %s", username)
         
-        # Try to find by nickname text
-        nickname_selectors = [
-            'css:p[class*="PInfoNickname"]',
-            'css:p[class*="Nickname"]',
-            'css:span[class*="Nickname"]',
-            'css:div[class*="Nickname"]',
-        ]
-        
-        for selector in nickname_selectors:
+        key = normalize_nickname(username)
+        cached = self._contact_elements.get(key)
+        if cached:
+            # The list reorders after every send, so make sure the handle
+            # still belongs to this contact
+            if self._shows_nickname(cached, key):
+                logger.debug("Found contact in element cache")
+                return cached
+            self._contact_elements.pop(key, None)
+        
+        # Element handles die on reload, but the xpath may still point at the
+        # same conversation; the list reorders after sends, so only accept it
+        # if its nickname matches exactly
+        locator = self._contact_locators.get(key)
+        if locator:
             try:
-                elements = self.page.eles(selector)
-                for elem in elements:
-                    if elem.text and elem.text.strip().lower() == username.lower():
-                        # Find parent container to click
-                        parent = elem
-                        for _ in range(10):
-                            try:
-                                parent = parent.parent()
-                                if parent:
-                                    parent_class = parent.attr('class') or ''
-                                    if 'Item' in parent_class or 'item' in parent_class or 'Container' in parent_class:
-                                        logger.debug(f"Found contact via selector: {selector}")
-                                        return parent
-                            except:
-                                break
-            except:
-                continue
+                elem = self.page.ele(f'xpath:{locator}', timeout=1)
+                if elem and self._shows_nickname(elem, key):
+                    logger.debug("Found contact via remembered xpath")
+                    self._contact_elements[key] = elem
+                    return elem
+            except Exception as e:
+                logger.debug("Remembered xpath failed: %s", e)
+            self._contact_locators.pop(key, None)
+        
+        # Try to find by nickname text
+        try:
+            elements = self.page.eles(NICKNAME_SELECTOR)
+            for elem in elements:
+                if elem.text and normalize_nickname(elem.text.strip()) == key:
+                    # Find parent container to click
+                    parent = self._find_conversation_container(elem)
+                    if parent:
+                        logger.debug("Found contact via nickname selector")
+                        self._remember_contact(username, parent)
+                        return parent
+        except:
+            pass
         
         # Fallback: Try xpath
         try:
@@ -667,28 +1219,19 @@ class TikTokStreakBot:
     
     def _find_message_input(self):
         """
-        Find message input field with multiple selectors.
+        Find message input field with a combined selector.
         
         Returns:
             Input element if found, None otherwise
         """
-        selectors = [
-            'css:div[data-e2e="message-input"]',
-            'css:div[contenteditable="true"]',
-            'css:textarea[placeholder*="message"]',
-            'css:input[placeholder*="message"]',
-            'css:div[class*="Input"] div[contenteditable="true"]',
-        ]
-        
-        for selector in selectors:
-            try:
-                elem = self.page.ele(selector, timeout=2)
-                if elem:
-                    logger.debug(f"Found input via: {selector}")
-                    return elem
-            except:
-                continue
+        try:
+            elem = self.page.ele(MESSAGE_INPUT_SELECTOR, timeout=ELEMENT_WAIT)
+            if elem:
+                return elem
+        except Exception as e:
+            logger.debug(f"Input lookup failed: {e}")
         
+        logger.debug("No input matched any of: %s", MESSAGE_INPUT_SELECTOR)
         return None
     
     def _scroll_messages_list(self):
@@ -707,17 +1250,13 @@ class TikTokStreakBot:
             logger.info("No contacts to message")
             return 0
         
-        success_count = 0
-        
-        for contact in self.contacts_found:
-            if self.test_mode:
-                logger.info(f"[TEST MODE] Would send to: {contact.get('username')}")
-                success_count += 1
-            else:
-                if self.send_message(contact):
-                    success_count += 1
-                # Small delay between messages
-                time.sleep(1)
+        if self.test_mode:
+            would_send = "\n".join(f"   - {contact.get('username')}" for contact in self.contacts_found)
+            logger.info(f"[TEST MODE] Would send to:\n{would_send}")
+            success_count = len(self.contacts_found)
+        else:
+            # send_message already waits MESSAGE_SEND_DELAY after each send
+            success_count = sum(1 for contact in self.contacts_found if self.send_message(contact))
         
         logger.info(f"📊 Sent {success_count}/{len(self.contacts_found)} messages successfully")
         return success_count
@@ -726,11 +1265,12 @@ class TikTokStreakBot:
         """Main bot execution flow."""
         logger.info("="*60)
         logger.info("🚀 TikTok Streak Bot Starting")
-        logger.info(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        started_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        logger.info(f"⏰ Time: {started_at}")
         logger.info("="*60)
         
-        # Send start notification
-        send_telegram("🚀 <b>TikTok Streak Bot Started</b>\n⏰ " + datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        # Start notification (sent with the rest when the run ends)
+        self._notify(RUN_STARTED_TEMPLATE.format(time=started_at))
         
         success_count = 0
         total_contacts = 0
@@ -738,7 +1278,7 @@ class TikTokStreakBot:
         try:
             # Load target contacts from JSON
             if not self.load_target_contacts():
-                send_telegram("❌ <b>Bot Error</b>\nFailed to load contacts from contacts.json")
+                self._notify("❌ <b>Bot Error</b>\nFailed to load contacts from contacts.json")
                 return False
             
             total_contacts = len(self.target_usernames)
@@ -748,12 +1288,12 @@ class TikTokStreakBot:
             
             # Load cookies
             if not self.load_cookies():
-                send_telegram("❌ <b>Bot Error</b>\nFailed to load cookies. Please update cookies.json")
+                self._notify("❌ <b>Bot Error</b>\nFailed to load cookies. Please update cookies.json")
                 return False
             
             # Verify login
             if not self.verify_login():
-                send_telegram("❌ <b>Bot Error</b>\nLogin failed. Cookies may have expired.")
+                self._notify("❌ <b>Bot Error</b>\nLogin failed. Cookies may have expired.")
                 return False
             
             # Find target contacts in message list
@@ -761,7 +1301,7 @@ class TikTokStreakBot:
             
             if not self.contacts_found:
                 logger.info("No target contacts found in message list")
-                send_telegram(f"⚠️ <b>No Contacts Found</b>\nCould not find any of the {total_contacts} target contacts in message list.")
+                self._notify(f"⚠️ <b>No Contacts Found</b>\nCould not find any of the {total_contacts} target contacts in message list.")
                 return True
             
             # Send messages
@@ -772,24 +1312,48 @@ class TikTokStreakBot:
             logger.info("="*60)
             
             # Send success notification
-            contact_list = "\n".join([f"  • {c['username']}" for c in self.contacts_found])
-            send_telegram(
-                f"✅ <b>Streak Messages Sent!</b>\n\n"
-                f"📊 <b>Result:</b> {success_count}/{len(self.contacts_found)} successful\n\n"
-                f"👥 <b>Contacts:</b>\n{contact_list}"
-            )
+            self._notify(RUN_RESULT_TEMPLATE.format(
+                sent=success_count,
+                total=len(self.contacts_found),
+                contacts="\n".join("  • " + html.escape(c['username']) for c in self.contacts_found),
+            ))
             
             return True
             
         except Exception as e:
             logger.error(f"Bot execution failed: {e}")
-            send_telegram(f"❌ <b>Bot Error</b>\n{str(e)}")
+            self._notify(f"❌ <b>Bot Error</b>\n{html.escape(str(e))}")
             return False
         
         finally:
             if self.page:
                 self.page.quit()
                 logger.info("Browser closed")
+            
+            # Make sure the result notification goes out before we return
+            self._send_notifications()
+            flush_telegram()
+            FILE_LOG_BUFFER.flush()
+    
+    def _notify(self, message):
+        """Collect a Telegram notification to send when the run ends."""
+        self._notifications.append(message)
+    
+    def _send_notifications(self):
+        """Send collected notifications as one message, split at Telegram's size limit."""
+        chunk = []
+        size = 0
+        for message in (piece for m in self._notifications for piece in split_message(m)):
+            if chunk and size + len(message) + 2 > TELEGRAM_MESSAGE_LIMIT:
+                send_telegram("\n\n".join(chunk))
+                chunk = []
+                size = 0
+            chunk.append(message)
+            size += len(message) + 2
+        
+        if chunk:
+            send_telegram("\n\n".join(chunk))
+        self._notifications = []
     
     def close(self):
         """Close the browser."""
@@ -804,55 +1368,41 @@ def run_scheduled_job():
     bot.run()
 
 
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="streak_bot.py",
+        description="🤖 TikTok Streak Bot - with no options, runs daily at the configured time.",
+        epilog=(
+            "Examples:\n"
+            "  python streak_bot.py --now\n"
+            "  python streak_bot.py --test\n"
+            "  python streak_bot.py --now --message \"Streak hari ini!\"\n"
+            "  python streak_bot.py --test -m \"Custom text\""
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--now", action="store_true", help="Run bot immediately (send messages now)")
+    mode.add_argument("--test", action="store_true", help="Test mode (find contacts but don't send)")
+    parser.add_argument("-m", "--message", metavar="TEXT", help="Custom message to send (overrides config)")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
-    # Parse command line arguments
-    args = sys.argv[1:]
-    
-    # Check for help
-    if '--help' in args or '-h' in args:
-        print("""
-╔════════════════════════════════════════════════════════════╗
-║              🤖 TikTok Streak Bot - Help                  ║
-╚════════════════════════════════════════════════════════════╝
-
-Usage:
-  python streak_bot.py [OPTIONS]
-
-Options:
-  --now              Run bot immediately (send messages now)
-  --test             Test mode (find contacts but don't send)
-  --message "text"   Custom message to send (overrides config)
-  -m "text"          Short form of --message
-  --help, -h         Show this help message
-
-Examples:
-  python streak_bot.py --now
-  python streak_bot.py --test
-  python streak_bot.py --now --message "Streak hari ini!"
-  python streak_bot.py --test -m "Custom text"
-
-Default (no args):
-  Schedule bot to run daily at configured time
-        """)
-        return
-    
-    # Parse custom message
-    custom_message = None
-    for i, arg in enumerate(args):
-        if arg in ['--message', '-m']:
-            if i + 1 < len(args):
-                custom_message = args[i + 1]
-                logger.info(f"Using custom message: {custom_message}")
-            break
+    args = parse_args()
+    custom_message = args.message
+    if custom_message:
+        logger.info(f"Using custom message: {custom_message}")
     
-    if '--now' in args:
+    if args.now:
         # Run immediately
         logger.info("Running bot immediately (--now flag)")
         bot = TikTokStreakBot(headless=HEADLESS_MODE, custom_message=custom_message)
         bot.run()
         
-    elif '--test' in args:
+    elif args.test:
         # Test mode - find contacts but don't send
         logger.info("Running in test mode (--test flag)")
         bot = TikTokStreakBot(headless=False, test_mode=True, custom_message=custom_message)
@@ -878,8 +1428,14 @@ Default (no args):
         # Keep running
         try:
             while True:
+                # Sleep until the next job is due instead of polling every minute;
+                # wake at least hourly so clock changes don't leave us oversleeping
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    break
+                if idle > 0:
+                    time.sleep(min(idle, 3600))
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
             print("\n👋 Bot stopped. Goodbye!")